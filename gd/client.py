@@ -1,12 +1,13 @@
 __doc__ = """Accessing the Geometry Dash API programmatically."""
 
 from typing import Union, Optional, Literal, Iterable, List
+import asyncio
 import random
-import base64
+import time
 
 from gd.str_helpers import (
     parse_comma_separated_int_list,
-    determine_search_difficulty,
+    determine_search_difficulties,
     parse_search_results,
     determine_demon_search_difficulty,
 )
@@ -47,7 +48,13 @@ from gd.enums import (
 from gd.level import Level, LevelDisplay, Comment, MapPack, LevelList, Gauntlet
 from gd.song import MusicLibrary, SoundEffectLibrary, Song
 from gd.user import Account, Player, AccountComment, Quest, Chest
-from gd.helpers import send_get_request, send_post_request, require_login
+from gd.helpers import (
+    send_get_request,
+    send_post_request,
+    require_login,
+    acquire_http_client,
+    release_http_client,
+)
 from gd.type_hints import (
     PlayerId,
     AccountId,
@@ -77,6 +84,22 @@ QUEST_ITEM_TYPE_MAP = {
     "3": Item.USERCOIN,
 }
 
+_LEVEL_RATING_FIELDS = {
+    LevelRating.NO_RATE: "noStar",
+    LevelRating.RATED: "star",
+    LevelRating.FEATURED: "featured",
+    LevelRating.EPIC: "epic",
+    LevelRating.LEGENDARY: "legendary",
+    LevelRating.MYTHIC: "mythic",
+}
+"""The search parameter enabled by each level rating filter."""
+
+_SPECIAL_LEVEL_IDS = {"DAILY": -1, "WEEKLY": -2, "EVENT": -3}
+"""The level ID the servers use for each special level."""
+
+LIBRARY_CACHE_TTL = 3600
+"""Seconds a downloaded music or SFX library is reused before downloading it again."""
+
 
 class Client:
     """
@@ -115,6 +138,11 @@ class Client:
     ) -> None:
         self.account = account
         self.udid = udid
+        self._library_cache = {}
+
+        # Share the HTTP connections with the other clients until `close`
+        acquire_http_client()
+        self._holds_http_client = True
 
         if self.udid is None:
             self.udid = generate_udid()
@@ -122,6 +150,45 @@ class Client:
     def __repr__(self) -> str:
         return f"<gd.Client account={self.account.account_id} at {hex(id(self))}>"
 
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Releases the HTTP connections kept open between requests.
+
+        The connections are shared between clients, so they are only closed once every
+        client using them has been closed. Also called when leaving
+        `async with gd.Client() as client:`.
+
+        :return: None
+        :rtype: None
+        """
+        if self._holds_http_client:
+            self._holds_http_client = False
+            await release_http_client()
+
+    def clear_cache(self) -> None:
+        """
+        Forgets the cached music and SFX libraries, so the next call downloads them again.
+
+        :return: None
+        :rtype: None
+        """
+        self._library_cache.clear()
+
+    def _get_cached_library(
+        self, name: str
+    ) -> Optional[Union[MusicLibrary, SoundEffectLibrary]]:
+        entry = self._library_cache.get(name)
+        if entry is not None and time.monotonic() - entry[0] < LIBRARY_CACHE_TTL:
+            return entry[1]
+
+        return None
+
     def logged_in(self) -> bool:
         """
         If the client has logged in or not.
@@ -171,10 +238,11 @@ class Client:
         if self.account:
             raise LoginError("The client has already been logged in!")
 
+        password_hash = gjp2(password)
         data = {
             "secret": LOGIN_SECRET,
             "userName": name,
-            "gjp2": gjp2(password),
+            "gjp2": password_hash,
             "udid": self.udid,
         }
 
@@ -200,7 +268,11 @@ class Client:
 
         account_id, player_id = parse_comma_separated_int_list(response)
         self.account = Account(
-            account_id=account_id, player_id=player_id, name=name, password=password
+            account_id=account_id,
+            player_id=player_id,
+            name=name,
+            password=password,
+            gjp2=password_hash,
         )
         return self.account
 
@@ -253,7 +325,7 @@ class Client:
         data = {
             "secret": SECRET,
             "accountID": self.account.account_id,
-            "comment": base64.urlsafe_b64encode(message.encode()).decode(),
+            "comment": base64_urlsafe_encode(message),
             "gjp2": self.account.gjp2,
         }
 
@@ -290,17 +362,12 @@ class Client:
             "levelID": level_id,
             "userName": self.account.name,
             "percent": percentage,
-            "comment": base64.urlsafe_b64encode(message.encode()).decode(),
+            "comment": base64_urlsafe_encode(message),
             "gjp2": self.account.gjp2,
         }
 
         data["chk"] = generate_chk(
-            values=[
-                data["userName"],
-                data["comment"],
-                data["levelID"],
-                data["percent"],
-            ],
+            values=f"{data['userName']}{data['comment']}{level_id}{percentage}",
             key=XorKey.COMMENT,
             salt=Salt.COMMENT,
         )
@@ -391,10 +458,16 @@ class Client:
         :return: A `Level` instance containing the downloaded level data.
         :rtype: :class:`gd.objects.Level`
         """
+        # Negative IDs are only valid for the special levels
+        if isinstance(level_id, int) and (level_id == 0 or level_id < -3):
+            raise InvalidID(f"Invalid level ID {level_id}.")
 
         response = await send_post_request(
             url="http://www.boomlings.com/database/downloadGJLevel22.php",
-            data={"levelID": level_id, "secret": SECRET},
+            data={
+                "levelID": _SPECIAL_LEVEL_IDS.get(level_id, level_id),
+                "secret": SECRET,
+            },
         )
         response = response.text
 
@@ -430,7 +503,37 @@ class Client:
         check_response_errors(response, LoadError, "Unable to get special level data.")
         response = response.split("|")
 
-        return (response[1], int(response[0]))
+        return (int(response[1]), int(response[0]))
+
+    async def download_special_level(
+        self, special: SpecialLevel = "DAILY", time_left: bool = False
+    ) -> Union[Level, tuple[Level, int]]:
+        """
+        Downloads the current daily, weekly or event level.
+
+        :param special: The special level to download. Defaults to "DAILY".
+        :type special: SpecialLevel
+        :param time_left: Whether to also return the time left in seconds before the next level. Only for daily and weekly.
+        :type time_left: bool
+        :raises: gd.InvalidID
+        :raises: gd.LoadError
+        :raises: ValueError
+        :return: A `Level` instance, or a tuple of it and the time left if `time_left` is True.
+        :rtype: Union[:class:`gd.objects.Level`, tuple[:class:`gd.objects.Level`, int]]
+        """
+        if not time_left:
+            return await self.download_level(special)
+
+        if special == "EVENT":
+            raise ValueError(
+                "The time left is only available for daily and weekly levels."
+            )
+
+        # Both requests are independent, so they are sent at the same time.
+        level, (seconds_left, _) = await asyncio.gather(
+            self.download_level(special), self.special_level_data(special == "WEEKLY")
+        )
+        return level, seconds_left
 
     async def search_level(
         self,
@@ -490,10 +593,12 @@ class Client:
         if src_filter == SearchFilter.FRIENDS and not self.logged_in():
             raise ValueError("Cannot filter by friends without being logged in.")
 
-        if not isinstance(difficulty, Iterable):
-            difficulty = tuple(difficulty)
+        if difficulty is None:
+            difficulty = ()
+        elif not isinstance(difficulty, Iterable):
+            difficulty = (difficulty,)
 
-        if Difficulty.DEMON in difficulty and len(difficulty) > 2:
+        if Difficulty.DEMON in difficulty and len(difficulty) > 1:
             raise ValueError("Difficulty.DEMON must not be with other difficulties.")
 
         # Initialize data
@@ -503,44 +608,33 @@ class Client:
                 src_filter.value if isinstance(src_filter, SearchFilter) else src_filter
             ),
             "page": page,
-            **{  # Level rating check
-                "noStar": 1 if level_rating == LevelRating.NO_RATE else None,
-                "star": 1 if level_rating == LevelRating.RATED else None,
-                "featured": 1 if level_rating == LevelRating.FEATURED else None,
-                "epic": 1 if level_rating == LevelRating.EPIC else None,
-                "legendary": 1 if level_rating == LevelRating.MYTHIC else None,
-                "mythic": 1 if level_rating == LevelRating.LEGENDARY else None,
-            },
-            **{  # Difficulty and demon difficulty checks
-                "diff": (
-                    ",".join(
-                        str(determine_search_difficulty(diff)) for diff in difficulty
-                    )
-                    if difficulty
-                    else None
-                ),
-                "demonFilter": (
-                    determine_search_difficulty(demon_difficulty)
-                    if demon_difficulty and difficulty == Difficulty.DEMON
-                    else None
-                ),
-            },
-            **{  # Optional parameters
-                "customSong": 1 if song_id else None,
-                "song": song_id,
-                "length": length.value if length else None,
-                "twoPlayer": int(two_player_mode) if two_player_mode else None,
-                "coins": int(has_coins) if has_coins else None,
-                "original": int(original) if original else None,
-                "gdw": int(gd_world) if gd_world else None,
-                "str": query or None,
-                "accountID": self.account.account_id if self.account else None,
-                "gjp2": self.account.gjp2 if self.account else None,
-            },
         }
 
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        # Only add the filters that are set
+        if level_rating is not None:
+            data[_LEVEL_RATING_FIELDS[level_rating]] = 1
+        if difficulty:
+            data["diff"] = determine_search_difficulties(difficulty)
+        if demon_difficulty and Difficulty.DEMON in difficulty:
+            data["demonFilter"] = determine_demon_search_difficulty(demon_difficulty)
+        if song_id:
+            data["customSong"] = 1
+            data["song"] = song_id
+        if length is not None:
+            data["length"] = length.value
+        if two_player_mode:
+            data["twoPlayer"] = 1
+        if has_coins:
+            data["coins"] = 1
+        if original:
+            data["original"] = 1
+        if gd_world:
+            data["gdw"] = 1
+        if query:
+            data["str"] = query
+        if self.account:
+            data["accountID"] = self.account.account_id
+            data["gjp2"] = self.account.gjp2
 
         # Perform search
         search_data = await send_post_request(
@@ -556,6 +650,26 @@ class Client:
             for result in parsed_results
         ]
 
+    async def search_level_pages(
+        self, pages: Iterable[int], **kwargs
+    ) -> list[list[LevelDisplay]]:
+        """
+        Searches several pages of the same level search at the same time.
+
+        Every page is a separate request, keep the number of pages small to avoid rate limits.
+
+        :param pages: The page numbers to load.
+        :type pages: Iterable[int]
+        :param **kwargs: The other search parameters, as passed to `search_level`.
+        :raises: gd.LoadError
+        :raises: ValueError
+        :return: A list of the `LevelDisplay` lists of every page, in the same order as `pages`.
+        :rtype: list[list[:class:`gd.objects.LevelDisplay`]]
+        """
+        return await asyncio.gather(
+            *(self.search_level(page=page, **kwargs) for page in pages)
+        )
+
     @require_login("You need to log in before you can view the leaderboard.")
     async def level_leaderboard(
         self,
@@ -594,18 +708,16 @@ class Client:
         )
 
         check_response_errors(
-            response,
+            response.text,
             LoadError,
             "Unable to get level leaderboard.",
         )
 
-        response = response.text.split("#")[0].split("|")
-
         return [
-            Player.from_raw(player_data, parse_leaderboard_score=True).attach_client(
-                self
+            player.attach_client(self)
+            for player in Player.from_raw_batch(
+                response.text, parse_leaderboard_score=True
             )
-            for player_data in response
         ]
 
     @require_login("You need to log in before you can view the leaderboard.")
@@ -655,49 +767,61 @@ class Client:
         )
 
         check_response_errors(
-            response,
+            response.text,
             LoadError,
             "Unable to get platformer level leaderboard.",
         )
 
-        response = response.text.split("#")[0].split("|")
-
         return [
-            Player.from_raw(player_data, parse_leaderboard_score=True).attach_client(
-                self
+            player.attach_client(self)
+            for player in Player.from_raw_batch(
+                response.text, parse_leaderboard_score=True
             )
-            for player_data in response
         ]
 
     async def music_library(self) -> MusicLibrary:
         """
         Gets the current music library in RobTop's servers.
 
+        The library is cached for `LIBRARY_CACHE_TTL` seconds, see `clear_cache`.
+
         :return: A `MusicLibrary` instance containing all the music library data.
         :rtype: :class:`gd.objects.song.MusicLibrary`
         """
+        cached = self._get_cached_library("music")
+        if cached is not None:
+            return cached
+
         response = await send_get_request(
             url="https://geometrydashfiles.b-cdn.net/music/musiclibrary_02.dat",
         )
         response = response.content.decode()
 
-        music_library = base64_urlsafe_decompress(response)
-        return MusicLibrary.from_raw(music_library)
+        music_library = MusicLibrary.from_raw(base64_urlsafe_decompress(response))
+        self._library_cache["music"] = (time.monotonic(), music_library)
+        return music_library
 
     async def sfx_library(self) -> SoundEffectLibrary:
         """
         Gets the current Sound Effect library in RobTop's servers.
 
+        The library is cached for `LIBRARY_CACHE_TTL` seconds, see `clear_cache`.
+
         :return: A `SoundEffectLibrary` instance containing all the SFX library data.
         :rtype: :class:`gd.objects.song.SoundEffectLibrary`
         """
+        cached = self._get_cached_library("sfx")
+        if cached is not None:
+            return cached
+
         response = await send_get_request(
             url="https://geometrydashfiles.b-cdn.net/sfx/sfxlibrary.dat",
         )
         response = response.content.decode()
 
-        sfx_library = base64_urlsafe_decompress(response)
-        return SoundEffectLibrary.from_raw(sfx_library)
+        sfx_library = SoundEffectLibrary.from_raw(base64_urlsafe_decompress(response))
+        self._library_cache["sfx"] = (time.monotonic(), sfx_library)
+        return sfx_library
 
     async def get_song(self, song_id: CustomSongId) -> Song:
         """
@@ -709,6 +833,9 @@ class Client:
         :raises: gd.InvalidID
         :rtype: :class:`gd.objects.song.Song`
         """
+        if isinstance(song_id, int) and song_id <= 0:
+            raise InvalidID(f"Invalid song ID {song_id}.")
+
         response = await send_post_request(
             url="http://www.boomlings.com/database/getGJSongInfo.php",
             data={"secret": SECRET, "songID": song_id},
@@ -733,6 +860,11 @@ class Client:
         :return: A `Player` instance containing the user's profile data.
         :rtype: :class:`gd.objects.user.Player`
         """
+        if isinstance(query, int) and query <= 0:
+            raise InvalidID(f"Invalid account ID {query}.")
+
+        if isinstance(query, str) and not query.strip():
+            raise InvalidID("The account name must not be empty.")
 
         if use_id:
             url = "http://www.boomlings.com/database/getGJUserInfo20.php"
@@ -750,7 +882,7 @@ class Client:
         response = response.text
 
         check_response_errors(response, InvalidID, f"Invalid account name/ID {query}.")
-        return Player.from_raw(response.split("#")[0]).attach_client(self)
+        return Player.from_raw(response.partition("#")[0]).attach_client(self)
 
     async def get_comments(
         self, level_id: LevelOrListId, page: int = 0
@@ -780,8 +912,7 @@ class Client:
         check_response_errors(response, InvalidID, f"Invalid level ID {level_id}.")
 
         comments = [
-            Comment.from_raw(comment_data).attach_client(self)
-            for comment_data in response.split("|")
+            comment.attach_client(self) for comment in Comment.from_raw_many(response)
         ]
 
         for comment in comments:
@@ -789,6 +920,26 @@ class Client:
 
         return comments
 
+    async def get_comments_pages(
+        self, level_id: LevelOrListId, pages: Iterable[int]
+    ) -> list[list[Comment]]:
+        """
+        Get several pages of comments of a level/list at the same time.
+
+        For lists, use a negative ID.
+
+        :param level_id: The ID of the level/list.
+        :type level_id: LevelOrListId
+        :param pages: The page numbers to load.
+        :type pages: Iterable[int]
+        :raises: gd.InvalidID
+        :return: A list of the `Comment` lists of every page, in the same order as `pages`.
+        :rtype: list[list[:class:`gd.objects.level.Comment`]]
+        """
+        return await asyncio.gather(
+            *(self.get_comments(level_id, page=page) for page in pages)
+        )
+
     async def get_user_account_comments(
         self, account_id: AccountId, page: int = 0
     ) -> Optional[list[AccountComment]]:
@@ -811,19 +962,13 @@ class Client:
 
         check_response_errors(response, InvalidID, "Invalid account ID.")
 
-        if not response.split("#")[0]:
+        if not response.partition("#")[0]:
             return None
 
-        posts_list = []
-        parsed_res = response.split("#")[0]
-        parsed_res = response.split("|")
-
-        for post in parsed_res:
-            posts_list.append(
-                AccountComment.from_raw(post, account_id).attach_client(self)
-            )
-
-        return posts_list
+        return [
+            post.attach_client(self)
+            for post in AccountComment.from_raw_many(response, account_id)
+        ]
 
     async def get_user_comments(
         self, player_id: PlayerId, page: int = 0, display_most_liked: bool = False
@@ -854,13 +999,11 @@ class Client:
 
         check_response_errors(response, InvalidID, "Invalid player ID.")
 
-        if not response.split("#")[0]:
+        comments = Comment.from_raw_many(response)
+        if not comments:
             return None
 
-        return [
-            Comment.from_raw(comment_data).attach_client(self)
-            for comment_data in response.split("#")[0].split("|")
-        ]
+        return [comment.attach_client(self) for comment in comments]
 
     async def get_user_levels(
         self, player_id: PlayerId, page: int = 0
@@ -884,12 +1027,13 @@ class Client:
 
         check_response_errors(response, InvalidID, f"Invalid account ID {player_id}.")
 
-        if not response.split("#")[0]:
+        levels = response.partition("#")[0]
+        if not levels:
             return None
 
         return [
             LevelDisplay.from_raw(level_data).attach_client(self)
-            for level_data in response.split("#")[0].split("|")
+            for level_data in levels.split("|")
         ]
 
     async def map_packs(self, page: int = 0) -> list[MapPack]:
@@ -899,7 +1043,7 @@ class Client:
         :param page: The page number to load, default is 0.
         :type page: int
         :raises: gd.LoadError
-        :return: A list of `MapPack` instances.
+        :return: A list of `MapPack` instances, empty past the last page.
         :rtype: list[:class:`gd.objects.level.MapPack`]
         """
         if page < 0:
@@ -908,6 +1052,19 @@ class Client:
         if page > 6:
             raise ValueError("Page limit is 6.")
 
+        map_packs, _ = await self._map_packs_page(page)
+        return map_packs
+
+    async def _map_packs_page(self, page: int) -> tuple[list[MapPack], int]:
+        """
+        Get a page of map packs, and how many pages of them there are.
+
+        :param page: The page number to load.
+        :type page: int
+        :raises: gd.LoadError
+        :return: A tuple of the `MapPack` instances and the number of pages.
+        :rtype: tuple[list[:class:`gd.objects.level.MapPack`], int]
+        """
         response = await send_post_request(
             url="http://www.boomlings.com/database/getGJMapPacks21.php",
             data={"secret": SECRET, "page": page},
@@ -917,11 +1074,36 @@ class Client:
         check_response_errors(
             response, LoadError, "An error occurred when getting map packs."
         )
-        map_packs = response.split("#")[0].split("|")
+        map_packs, _, page_info = response.partition("#")
+
+        # The page info is "total:offset:page size"
+        page_info = page_info.partition("#")[0].split(":")
+        page_count = 1
+        if len(page_info) >= 3 and int(page_info[2]):
+            page_count = -(-int(page_info[0]) // int(page_info[2]))
+
+        if not map_packs:
+            # Past the last page
+            return [], page_count
+
         return [
             MapPack.from_raw(map_pack_data).attach_client(self)
-            for map_pack_data in map_packs
-        ]
+            for map_pack_data in map_packs.split("|")
+        ], page_count
+
+    async def all_map_packs(self) -> list[MapPack]:
+        """
+        Get every map pack, loading all the pages after the first at the same time.
+
+        :raises: gd.LoadError
+        :return: A list of `MapPack` instances.
+        :rtype: list[:class:`gd.objects.level.MapPack`]
+        """
+        map_packs, page_count = await self._map_packs_page(0)
+        pages = await asyncio.gather(
+            *(self._map_packs_page(page) for page in range(1, page_count))
+        )
+        return map_packs + [map_pack for page, _ in pages for map_pack in page]
 
     async def gauntlets(self, ncs: bool = True) -> list[Gauntlet]:
         """
@@ -945,7 +1127,7 @@ class Client:
         check_response_errors(
             response, LoadError, "An error occurred when getting gauntlets."
         )
-        guantlets = response.split("#")[0].split("|")
+        guantlets = response.partition("#")[0].split("|")
         list_guantlets = [
             Gauntlet.from_raw(guantlet).attach_client(self) for guantlet in guantlets
         ]
@@ -983,10 +1165,12 @@ class Client:
         if src_filter == SearchFilter.FRIENDS and not self.logged_in():
             raise ValueError("Only friends search is available when logged in.")
 
-        if not isinstance(difficulty, Iterable):
-            difficulty = tuple(difficulty)
+        if difficulty is None:
+            difficulty = ()
+        elif not isinstance(difficulty, Iterable):
+            difficulty = (difficulty,)
 
-        if Difficulty.DEMON in difficulty and len(difficulty) > 2:
+        if Difficulty.DEMON in difficulty and len(difficulty) > 1:
             raise ValueError("Difficulty.DEMON must not be with other difficulties.")
 
         data = {
@@ -995,28 +1179,21 @@ class Client:
                 src_filter.value if isinstance(src_filter, SearchFilter) else src_filter
             ),
             "page": page,
-            "star": only_rated or None,
-            **{  # Difficulty and demon difficulty checks
-                "diff": (
-                    ",".join(
-                        str(determine_search_difficulty(diff)) for diff in difficulty
-                    )
-                    if difficulty
-                    else None
-                ),
-                "demonFilter": (
-                    determine_demon_search_difficulty(demon_difficulty)
-                    if demon_difficulty and difficulty == Difficulty.DEMON
-                    else None
-                ),
-            },
-            **{  # Optional parameters
-                "str": query or None,
-                "accountID": self.account.account_id if self.logged_in() else None,
-                "gjp2": self.account.gjp2 if self.logged_in() else None,
-            },
         }
 
+        # Only add the filters that are set
+        if only_rated:
+            data["star"] = 1
+        if difficulty:
+            data["diff"] = determine_search_difficulties(difficulty)
+        if demon_difficulty and Difficulty.DEMON in difficulty:
+            data["demonFilter"] = determine_demon_search_difficulty(demon_difficulty)
+        if query:
+            data["str"] = query
+        if self.logged_in():
+            data["accountID"] = self.account.account_id
+            data["gjp2"] = self.account.gjp2
+
         response = await send_post_request(
             url="http://www.boomlings.com/database/getGJLevelLists.php", data=data
         )
@@ -1027,7 +1204,7 @@ class Client:
             LoadError,
             "An error occurred while searching lists, maybe it doesn't exist?",
         )
-        response = response.split("#")[0]
+        response = response.partition("#")[0]
 
         return [
             LevelList.from_raw(level_list_data).attach_client(self)
@@ -1072,13 +1249,12 @@ class Client:
         )
 
         check_response_errors(
-            response, LoadError, "An error occurred when getting the leaderboard."
+            response.text, LoadError, "An error occurred when getting the leaderboard."
         )
 
-        response = response.text.split("#")[0].split("|")
-        del response[-1]
-
-        return [Player.from_raw(player).attach_client(self) for player in response]
+        return [
+            player.attach_client(self) for player in Player.from_raw_batch(response.text)
+        ]
 
     async def leaderboard_top_1000(
         self, html: bool = False
@@ -1265,7 +1441,7 @@ class Client:
 
         # Cryptography shit, removes salt and cyclic XOR them.
         response = cyclic_xor(
-            base64_urlsafe_decode(response.split("|")[0][5:]), XorKey.QUEST
+            base64_urlsafe_decode(response.partition("|")[0][5:]), XorKey.QUEST
         ).split(":")
 
         time_left = response[5]
@@ -1328,7 +1504,7 @@ class Client:
 
         # Cryptography stuff, removes salt and cyclic XOR them.
         response = cyclic_xor(
-            base64_urlsafe_decode(response.split("|")[0][5:]), XorKey.CHEST
+            base64_urlsafe_decode(response.partition("|")[0][5:]), XorKey.CHEST
         ).split(":")
 
         small_chest_time = int(response[5])
@@ -1526,7 +1702,7 @@ class Client:
             "binaryVersion": 45,
             "seed": generate_rs(),
             "seed2": generate_chk(
-                [gzip_compress(level_string)[:51]], XorKey.UPLOAD_LEVEL, Salt.LEVEL
+                gzip_compress(level_string)[:51], XorKey.UPLOAD_LEVEL, Salt.LEVEL
             ),
             "password": password if password else 0,
             "ts": verification_time,
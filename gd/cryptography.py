@@ -7,18 +7,46 @@ This module has limited documentation and is not intended to be used directly.
 """
 
 import base64
-import zlib
 import gzip
 import random
+from functools import lru_cache
 from string import ascii_letters, digits
 from hashlib import sha1
 from enum import StrEnum
+from typing import Iterable, Union
 
 from gd.type_hints import Udid
 
+try:
+    # SIMD-accelerated codec, installed with `geometry-dash[speedups]`
+    from pybase64 import urlsafe_b64decode as _urlsafe_b64decode
+    from pybase64 import urlsafe_b64encode as _urlsafe_b64encode
+except ImportError:
+    from binascii import a2b_base64, b2a_base64
+
+    _URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+    _STANDARD_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+    def _urlsafe_b64decode(encoded: str) -> bytes:
+        # What base64.urlsafe_b64decode does, without its wrapper calls
+        return a2b_base64(encoded.encode("ascii").translate(_URLSAFE_TO_STANDARD))
+
+    def _urlsafe_b64encode(data: bytes) -> bytes:
+        # What base64.urlsafe_b64encode does, without its wrapper calls
+        return b2a_base64(data, newline=False).translate(_STANDARD_TO_URLSAFE)
+
+
+try:
+    # ISA-L inflate, same API as zlib, installed with `geometry-dash[speedups]`
+    from isal.isal_zlib import decompress as _zlib_decompress
+except ImportError:
+    from zlib import decompress as _zlib_decompress
+
 # Constants
 XOR_KEY = "26364"
 BASE64_PADDING_CHAR = "="
+# The padding to append, indexed by the length of the data modulo 4
+BASE64_PADDINGS = ("", "===", "==", "=")
 AW_CODE = "Aw=="
 LETTERS = ascii_letters + digits
 
@@ -29,7 +57,10 @@ __all__ = [
     "singular_xor",
     "base64_urlsafe_encode",
     "base64_urlsafe_decode",
+    "base64_urlsafe_decode_many",
+    "base64_urlsafe_decode_str",
     "base64_urlsafe_decompress",
+    "base64_urlsafe_decompress_bytes",
     "base64_urlsafe_gzip_decompress",
     "generate_chk",
     "gjp2",
@@ -69,6 +100,10 @@ class Salt(StrEnum):
     GJP2 = PASSWORD
 
 
+_XOR_KEY_BYTES = {key.value: key.value.encode() for key in XorKey}
+_SALT_BYTES = {salt.value: salt.value.encode() for salt in Salt}
+
+
 def gjp2(password: str = "", salt: str = Salt.PASSWORD) -> str:
     """
     Convert a password to a GJP2 encrypted password.
@@ -79,10 +114,12 @@ def gjp2(password: str = "", salt: str = Salt.PASSWORD) -> str:
     :type salt: str
     :return: An encrypted password.
     """
-    password += salt
-    result = sha1(password.encode()).hexdigest()
+    # Feed the salt separately instead of concatenating, the known salts are
+    # already encoded at import time.
+    digest = sha1(password.encode())
+    digest.update(_SALT_BYTES.get(salt) or salt.encode())
 
-    return result
+    return digest.hexdigest()
 
 
 def generate_udid(start: int = 100_000, end: int = 100_000_000) -> Udid:
@@ -102,7 +139,7 @@ def generate_udid(start: int = 100_000, end: int = 100_000_000) -> Udid:
 
 def add_padding(encoded: str) -> str:
     """Ensure proper padding for Base64 strings."""
-    return encoded + BASE64_PADDING_CHAR * (-len(encoded) % 4)
+    return encoded + BASE64_PADDINGS[len(encoded) & 3]
 
 
 def cyclic_xor(input_bytes: bytes, key: str) -> str:
@@ -117,10 +154,28 @@ def cyclic_xor(input_bytes: bytes, key: str) -> str:
     :return: The XOR-encrypted/decrypted data as a string.
     :rtype: str
     """
-    key_bytes = key.encode()
-    return "".join(
-        chr(byte ^ key_bytes[i % len(key_bytes)]) for i, byte in enumerate(input_bytes)
-    )
+    key_bytes = _XOR_KEY_BYTES.get(key) or key.encode()
+    length = len(input_bytes)
+    if not length:
+        return ""
+
+    if length >= _XOR_STRIDE_THRESHOLD:
+        # Every key_length-th byte is XORed with the same key byte, so translate
+        # each of those strides with a table in C and write it back in place.
+        key_length = len(key_bytes)
+        output = bytearray(length)
+        for offset, table in enumerate(_xor_tables(key_bytes)):
+            output[offset::key_length] = input_bytes[offset::key_length].translate(
+                table
+            )
+        return output.decode("latin-1")
+
+    # XOR the whole buffer at once as two big integers instead of byte by byte,
+    # with the key repeated to the same length. Latin-1 maps each byte to the
+    # code point of the same value, like chr() would.
+    tiled_key = (key_bytes * (length // len(key_bytes) + 1))[:length]
+    xored = int.from_bytes(input_bytes, "big") ^ int.from_bytes(tiled_key, "big")
+    return xored.to_bytes(length, "big").decode("latin-1")
 
 
 def singular_xor(input_bytes: bytes, key: int) -> str:
@@ -135,11 +190,51 @@ def singular_xor(input_bytes: bytes, key: int) -> str:
     :return: The XOR-encrypted/decrypted data as a string.
     :rtype: str
     """
+    if 0 <= key < 256:
+        # Gamesaves are plain text, so go through a 256-byte translation table
+        # in C instead of XORing every character in Python.
+        try:
+            raw = input_bytes.encode("latin-1")
+        except UnicodeEncodeError:
+            pass
+        else:
+            return raw.translate(_single_xor_table(key)).decode("latin-1")
+
     string = [ord(char) for char in input_bytes]
     result = "".join(chr(char ^ key) for char in string)
     return result
 
 
+# From this size on, cyclic_xor translates strides instead of XORing big integers
+_XOR_STRIDE_THRESHOLD = 2048
+
+
+@lru_cache(maxsize=None)
+def _xor_tables(key_bytes: bytes) -> tuple[bytes, ...]:
+    """
+    Build one translation table per byte of a cyclic XOR key.
+
+    :param key_bytes: The XOR key.
+    :type key_bytes: bytes
+    :return: The translation tables for `bytes.translate`, in key order.
+    :rtype: tuple[bytes, ...]
+    """
+    return tuple(_single_xor_table(key) for key in key_bytes)
+
+
+@lru_cache(maxsize=None)
+def _single_xor_table(key: int) -> bytes:
+    """
+    Build the translation table that XORs every byte with `key`.
+
+    :param key: The XOR key, between 0 and 255.
+    :type key: int
+    :return: The translation table for `bytes.translate`.
+    :rtype: bytes
+    """
+    return bytes(byte ^ key for byte in range(256))
+
+
 def base64_urlsafe_decode(encrypted: str) -> bytes:
     """
     Decode base64-encoded data with padding and URL-safe encoding.
@@ -149,7 +244,37 @@ def base64_urlsafe_decode(encrypted: str) -> bytes:
     :return: The decoded base64-encoded data.
     :rtype: bytes
     """
-    return base64.urlsafe_b64decode(add_padding(encrypted))
+    return _urlsafe_b64decode(add_padding(encrypted))
+
+
+def base64_urlsafe_decode_many(encrypted: Iterable[str]) -> list[bytes]:
+    """
+    Decode multiple base64-encoded strings.
+
+    Each string is still decoded on its own, the decoder is only looked up once
+    for the whole batch instead of once per string.
+
+    :param encrypted: The base64-encoded strings to decode.
+    :type encrypted: Iterable[str]
+    :return: The decoded data, in the same order as the input.
+    :rtype: list[bytes]
+    """
+    decode = _urlsafe_b64decode
+    return [decode(add_padding(value)) for value in encrypted]
+
+
+@lru_cache(maxsize=512)
+def base64_urlsafe_decode_str(encrypted: str) -> str:
+    """
+    Decode base64-encoded text, memoized since descriptions and passwords are
+    often sent again in later responses.
+
+    :param encrypted: The base64-encoded text to decode.
+    :type encrypted: str
+    :return: The decoded text.
+    :rtype: str
+    """
+    return _urlsafe_b64decode(add_padding(encrypted)).decode()
 
 
 def base64_urlsafe_encode(value: str) -> str:
@@ -160,7 +285,24 @@ def base64_urlsafe_encode(value: str) -> str:
     :return: The base64-encoded value.
     :rtype: str
     """
-    return base64.urlsafe_b64encode(value.encode()).decode()
+    return _urlsafe_b64encode(value.encode()).decode("ascii")
+
+
+def base64_urlsafe_decompress_bytes(encrypted: str, wbits: int = 15 | 32) -> bytes:
+    """
+    Decode a base64 encoded string then decompress it with zlib, without decoding
+    the result to a string.
+
+    Useful when the data is only hashed, compared or written to a file, since it
+    saves a copy of the whole decompressed data.
+
+    :param encrypted: The base64-encoded string to decompress.
+    :type encrypted: str
+    :return: The decompressed data.
+    :rtype: bytes
+    """
+    decoded_data = _urlsafe_b64decode(add_padding(encrypted))
+    return _zlib_decompress(decoded_data, wbits)
 
 
 def base64_urlsafe_decompress(encrypted: str, wbits: int = 15 | 32) -> str:
@@ -172,8 +314,7 @@ def base64_urlsafe_decompress(encrypted: str, wbits: int = 15 | 32) -> str:
     :return: The decompressed data as a string.
     :rtype: str
     """
-    decoded_data = base64.urlsafe_b64decode(add_padding(encrypted))
-    return zlib.decompress(decoded_data, wbits).decode("utf-8")
+    return base64_urlsafe_decompress_bytes(encrypted, wbits).decode("utf-8")
 
 
 def base64_urlsafe_gzip_decompress(encrypted: str) -> str:
@@ -186,7 +327,7 @@ def base64_urlsafe_gzip_decompress(encrypted: str) -> str:
     :rtype: str
     """
     padded_data = add_padding(encrypted)
-    decoded_data = base64.urlsafe_b64decode(padded_data)
+    decoded_data = _urlsafe_b64decode(padded_data)
     return gzip.decompress(decoded_data).decode(errors="replace")
 
 
@@ -200,7 +341,7 @@ def base64_urlsafe_gzip_compress(plain: str) -> str:
     :rtype: str
     """
     compressed = gzip.compress(plain.encode("utf-8"))
-    encoded = base64.urlsafe_b64encode(compressed).decode()
+    encoded = _urlsafe_b64encode(compressed).decode("ascii")
     return encoded
 
 
@@ -265,12 +406,14 @@ def generate_digits() -> str:
     return result
 
 
-def generate_chk(values: list[any], key: XorKey = "", salt: Salt = "") -> str:
+def generate_chk(
+    values: Union[str, Iterable[any]], key: XorKey = "", salt: Salt = ""
+) -> str:
     """
     Generates CHK data.
 
-    :param values: The values to include in the CHK data.
-    :type values: list[any]
+    :param values: The values to include in the CHK data, or them already joined in a string.
+    :type values: Union[str, Iterable[any]]
     :param key: The XOR key to use.
     :type key: str
     :param salt: The salt to use for encryption.
@@ -278,11 +421,11 @@ def generate_chk(values: list[any], key: XorKey = "", salt: Salt = "") -> str:
     :return: The generated chk data as a string.
     :rtype: str
     """
+    if not isinstance(values, str):
+        values = "".join(map(str, values))
 
-    values.append(salt)
-    combined_str = "".join(map(str, values))
-
-    hashed = gjp2(combined_str, "")
+    # Hashing the salt after the values is the same as hashing them joined
+    hashed = gjp2(values, salt)
     xored = cyclic_xor(hashed.encode(), key)
 
-    return base64.urlsafe_b64encode(xored.encode()).decode()
+    return _urlsafe_b64encode(xored.encode()).decode("ascii")
@@ -4,8 +4,9 @@
 A module containing all enumerations of various things.
 """
 
+import sys
 from enum import IntEnum, Enum, StrEnum, auto
-from typing import Literal, Union
+from typing import Literal, Union, get_args
 
 # Literals
 SpecialLevel = Literal["DAILY", "WEEKLY", "EVENT"]
@@ -47,7 +48,6 @@ Folders = Literal[
     "Scary",
     "Explosions and Destruction",
     "Sci-Fi",
-    "Underwater",
     "Fire and Flames",
     "Footsteps",
     "Impacts and Hits",
@@ -67,7 +67,6 @@ Folders = Literal[
     "Geometry Dash",
     "Humorous",
     "Other",
-    "Retro",
     "Swipes and Wind",
     "UI Actions",
     "Locations",
@@ -89,8 +88,6 @@ Folders = Literal[
     "Melodic Reese Pad",
     "Melodic Synth",
     "One Shots",
-    "Bass",
-    "Drum Perc",
     "Claps",
     "Crashes",
     "HiHats",
@@ -101,26 +98,9 @@ Folders = Literal[
     "Synth",
     "Vocal",
     "Fire Dubstep",
-    "Loops",
-    "Bass",
-    "Drum Perc",
-    "FX",
-    "Melodic",
-    "One Shots",
-    "Bass",
-    "Drum Perc",
-    "Claps",
-    "HiHats",
-    "Kicks",
-    "Percussion",
-    "Rides",
-    "Snares",
     "FX",
     "Melodic",
-    "Vocal",
     "Sharks",
-    "Atmosphere",
-    "Loops",
     "Drum Loops",
     "Guitar Loops",
     "Song Loops",
@@ -134,15 +114,11 @@ Folders = Literal[
     "Melodic Drumstep E minor 174 bpm",
     "Phonk Db minor 174 bpm",
     "Tonal Loops",
-    "One Shots",
-    "Bass",
     "Drums",
     "Fills",
     "Sfx",
     "Synths",
     "Vocals",
-    "Various",
-    "Drum Loops",
     "Hits",
     "Objects",
     "Cards and Dice",
@@ -173,8 +149,6 @@ Folders = Literal[
     "Melodic Events",
     "Miscellaneous",
     "Movement",
-    "Pick Ups",
-    "Power Up Down",
     "UI",
     "Access Denied",
     "Buttons",
@@ -187,11 +161,9 @@ Folders = Literal[
     "Spells and Magic",
     "Buffs",
     "Casting",
-    "Effects",
     "Explosion",
     "Impacts",
     "Shoot",
-    "Various",
     "Ambience",
     "Spooky and Scary",
     "Sports and Athletics",
@@ -221,41 +193,20 @@ Folders = Literal[
     "Laughing",
     "Vocalizations",
     "Demon 02",
-    "Common",
-    "Custom",
-    "Vocalizations",
     "Dont",
     "Enemy NPCs",
     "Enemy 01",
-    "Laughing",
     "Vocalization",
     "Voicelines",
     "Enemy 02",
-    "Laughing",
-    "Vocalization",
-    "Voicelines",
     "Enemy 03",
-    "Laughing",
-    "Vocalization",
-    "Voicelines",
     "Enemy 04",
-    "Laughing",
-    "Vocalization",
-    "Voicelines",
     "Enemy 05",
-    "Laughing",
-    "Vocalization",
-    "Voicelines",
     "FPS Announcer",
     "GLaDAI",
     "Knight",
-    "Battle Cries",
-    "Common",
     "Coughing",
     "Crying",
-    "Custom",
-    "Laughing",
-    "Vocalization",
     "Merchant 01",
     "Merchant 02",
     "Greetings",
@@ -277,20 +228,12 @@ Folders = Literal[
     "Orders",
     "Support",
     "Necromancer",
-    "Common",
-    "Custom",
-    "Vocalizations",
     "Necromancer Lord",
-    "Common",
-    "Custom",
-    "Vocalizations",
     "Random Guy 01",
     "Trailer Voice",
     "Ultimate Announcer",
-    "Vocalizations",
     "Human Male 01",
     "Humanoid",
-    "Laughing",
     "Female Type 01",
     "Female Type 02",
     "Female Type 03",
@@ -300,13 +243,7 @@ Folders = Literal[
     "Small Humanoid",
     "Wizard",
     "Wraith",
-    "Common",
-    "Custom",
-    "Vocalizations",
-    "Weapons",
-    "Effects",
     "Whoosh",
-    "Futuristic",
     "Blaster",
     "Boosted Shotgun",
     "Chain Gun",
@@ -317,13 +254,10 @@ Folders = Literal[
     "Handling",
     "Reload",
     "High Tech",
-    "Interface",
     "Laser Sword",
     "Laser Weapon",
     "Night Vision",
     "Plasma Weapon",
-    "Spaceship",
-    "Various",
     "Handling Noises",
     "Historical",
     "Cannon",
@@ -335,13 +269,11 @@ Folders = Literal[
     "Blade Sharp",
     "Blade Small",
     "Bow and Arrow",
-    "Effects",
     "Impact",
     "Impact Flesh",
     "Maul Hammer",
     "Sharp Dagger",
     "Siege Weapon",
-    "Various",
     "Modern",
     "AK47",
     "Grenade",
@@ -373,7 +305,6 @@ Tags = Literal[
     "tavern",
     "western",
     "16bit",
-    "8bit",
     "Acion",
     "Action",
     "Adventure",
@@ -604,8 +535,58 @@ Tags = Literal[
 ]
 
 
+# Built once at import, so membership checks are a single hash lookup. Names with
+# spaces aren't interned by the compiler, so intern them here to share one copy.
+_FOLDERS = frozenset(map(sys.intern, get_args(Folders)))
+_TAGS = frozenset(map(sys.intern, get_args(Tags)))
+
+
+def is_valid_folder(folder_name: str) -> bool:
+    """
+    Check if the name is a known sound effect folder.
+
+    :param folder_name: The folder name to check.
+    :type folder_name: str
+    :return: True if the folder is known, False otherwise.
+    :rtype: bool
+    """
+    return folder_name in _FOLDERS
+
+
+def is_valid_tag(tag: str) -> bool:
+    """
+    Check if the name is a known music library tag.
+
+    :param tag: The tag to check.
+    :type tag: str
+    :return: True if the tag is known, False otherwise.
+    :rtype: bool
+    """
+    return tag in _TAGS
+
+
 # Enum
-class OfficialSong(Enum):
+class _ValueLookup:
+    """
+    Mixin for enums that are parsed from server responses.
+    """
+
+    @classmethod
+    def by_value(cls, value, default=None):
+        """
+        Returns the member with the given value, or `default` if there is none.
+
+        Unlike calling the enum, this is a single dict lookup, without going
+        through `Enum.__call__` and raising for unknown values.
+
+        :param value: The value of the member.
+        :param default: What to return if no member has this value.
+        :return: The member with the given value, or `default`.
+        """
+        return cls._value2member_map_.get(value, default)
+
+
+class OfficialSong(_ValueLookup, Enum):
     """
     Represents official songs in the game.
     """
@@ -635,7 +616,7 @@ class OfficialSong(Enum):
     # Add more official songs here
 
 
-class Difficulty(Enum):
+class Difficulty(_ValueLookup, Enum):
     """
     Represents the non-demon difficulty levels.
     """
@@ -658,7 +639,7 @@ class Difficulty(Enum):
     """Auto difficulty."""
 
 
-class DemonDifficulty(Enum):
+class DemonDifficulty(_ValueLookup, Enum):
     """
     Represents the demon difficulty levels.
     """
@@ -677,7 +658,7 @@ class DemonDifficulty(Enum):
     DEFAULT = HARD_DEMON
 
 
-class Length(IntEnum):
+class Length(_ValueLookup, IntEnum):
     """
     Represents the length of a level.
     """
@@ -696,7 +677,7 @@ class Length(IntEnum):
     """Platformer level type."""
 
 
-class LevelRating(Enum):
+class LevelRating(_ValueLookup, Enum):
     """
     Represents the rating of a level.
     """
@@ -715,7 +696,7 @@ class LevelRating(Enum):
     """Legendary level."""
 
 
-class ModRank(IntEnum):
+class ModRank(_ValueLookup, IntEnum):
     """
     Represents the moderator status of a level.
     """
@@ -729,7 +710,7 @@ class ModRank(IntEnum):
     DEFAULT = NONE
 
 
-class Gamemode(Enum):
+class Gamemode(_ValueLookup, Enum):
     """
     Represents the different gamemodes.
     """
@@ -803,7 +784,7 @@ class Leaderboard(StrEnum):
     DEFAULT = TOP
 
 
-class Item(Enum):
+class Item(_ValueLookup, Enum):
     """
     Represents items/collectables.
     """
@@ -826,15 +807,14 @@ class Item(Enum):
         :return: The corresponding `Item` or `Shard`.
         :rtype: Union["Item.DEMON_KEY", "Shard", None]
         """
-        if item_id == 0:
-            return None
-        if item_id == 5:
-            return Item.DEMON_KEY
+        if item_id in _CHEST_ITEM_BY_ID:
+            return _CHEST_ITEM_BY_ID[item_id]
 
+        # Unknown IDs still raise the usual ValueError
         return Shard(item_id)
 
 
-class Shard(Enum):
+class Shard(_ValueLookup, Enum):
     """
     Represents shard types.
     """
@@ -849,3 +829,12 @@ class Shard(Enum):
     METAL = 12
     LIGHT = 13
     SOUL = 14
+
+
+# Chest item IDs resolved with one dict lookup.
+# 5 means a demon key here, not the lava shard.
+_CHEST_ITEM_BY_ID = {
+    **{shard.value: shard for shard in Shard},
+    0: None,
+    5: Item.DEMON_KEY,
+}
@@ -16,6 +16,20 @@ if TYPE_CHECKING:
 __all__ = ["GDItem", "Downloadable"]
 
 
+def _rebuild_item(cls: type, state: object, client: Optional[Client]) -> GDItem:
+    """Recreate a pickled or copied :class:`GDItem` together with its client."""
+    item = cls.__new__(cls)
+    if hasattr(item, "__setstate__"):
+        item.__setstate__(state)
+    elif state:
+        # Default ``object.__getstate__`` layout: ``__dict__`` or ``(__dict__, slots)``.
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for name, value in {**(dict_state or {}), **(slot_state or {})}.items():
+            object.__setattr__(item, name, value)
+    item.client = client
+    return item
+
+
 class GDItem:
     """
     An abstract class representing an object.
@@ -26,8 +40,21 @@ class GDItem:
         The client attached to the object. Used for accounts login and interaction.
     """
 
-    client: Optional[Client] = None  # type: ignore
-    """The client attached to the object. Used for accounts login and interaction."""
+    __slots__ = ("_client",)
+
+    @property
+    def client(self) -> Optional[Client]:  # type: ignore
+        """The client attached to the object. Used for accounts login and interaction."""
+        return getattr(self, "_client", None)
+
+    @client.setter
+    def client(self, client: Optional[Client]) -> None:  # type: ignore
+        self._client = client
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # Slotted attrs subclasses generate a ``__getstate__`` that only covers their
+        # fields, so the ``_client`` slot is carried next to that state instead.
+        return _rebuild_item, (type(self), self.__getstate__(), self.client)
 
     def attach_client(self, client: Client) -> Self:  # type: ignore
         """
@@ -60,6 +87,8 @@ class Downloadable:
     A class representing an item that can be downloaded.
     """
 
+    __slots__ = ()
+
     async def buffer(self) -> BytesIO:
         """
         Gets the content and returns it as a BytesIO object.
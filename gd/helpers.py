@@ -6,9 +6,11 @@ A module containing all helper functions for the module.
 You typically don't want to use this module because it has limited documentation and confusing to use.
 """
 
+import asyncio
 from functools import wraps
 from io import BytesIO
 from pathlib import Path
+from typing import Iterable, Optional
 
 import aiofiles
 import httpx
@@ -20,6 +22,10 @@ __all__ = [
     "require_login",
     "send_post_request",
     "send_get_request",
+    "send_post_batch",
+    "acquire_http_client",
+    "release_http_client",
+    "close_http_client",
 ]
 
 
@@ -38,15 +44,28 @@ def require_client(
     """
 
     def decorator(func):
-        @wraps(func)
-        async def wrapper(self, *args, **kwargs):
-            if not self.client:
-                raise ValueError(error_message)
+        # Pick the wrapper once here, so the common no-login case only does one check
+        if login:
 
-            if login and not self.client.logged_in:
-                raise LoginError("The client is not logged in.")
+            @wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                client = self.client
+                if not client:
+                    raise ValueError(error_message)
 
-            return await func(self, *args, **kwargs)
+                if not client.logged_in():
+                    raise LoginError("The client is not logged in.")
+
+                return await func(self, *args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                if not self.client:
+                    raise ValueError(error_message)
+
+                return await func(self, *args, **kwargs)
 
         return wrapper
 
@@ -77,6 +96,106 @@ def require_login(message: str = "You need to login before you can use this func
 
 
 # * HTTP Helper Functions with httpx
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+# How many open `Client` instances share the connections
+_http_client_users = 0
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared httpx.AsyncClient, so connections are reused between requests.
+
+    A new one is created if there is none yet, if it was closed, or if the running
+    event loop changed since it was created (e.g. between `asyncio.run` calls), in
+    which case the old one is closed first.
+
+    :return: The shared client.
+    :rtype: httpx.AsyncClient
+    """
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and _http_client_loop is not loop:
+        await _discard_http_client()
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(headers={"User-Agent": ""})
+        _http_client_loop = loop
+
+    return _http_client
+
+
+async def _discard_http_client() -> None:
+    """
+    Closes the shared httpx.AsyncClient from whichever event loop it belongs to.
+
+    :return: None
+    :rtype: None
+    """
+    global _http_client, _http_client_loop
+
+    client, loop = _http_client, _http_client_loop
+    _http_client = None
+    _http_client_loop = None
+
+    if client is None or client.is_closed:
+        return
+
+    if loop is asyncio.get_running_loop():
+        await client.aclose()
+    elif loop.is_running():
+        # Its connections belong to a loop running in another thread, close them there.
+        future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        await asyncio.wrap_future(future)
+    else:
+        # The loop has stopped, so the connections can't be shut down through it.
+        # Closing still marks the pool closed, and dropping the last reference
+        # releases the sockets.
+        try:
+            await client.aclose()
+        except RuntimeError:
+            pass
+
+
+def acquire_http_client() -> None:
+    """
+    Registers a user of the shared connections, see `release_http_client`.
+
+    :return: None
+    :rtype: None
+    """
+    global _http_client_users
+
+    _http_client_users += 1
+
+
+async def release_http_client() -> None:
+    """
+    Unregisters a user of the shared connections, closing them once nobody uses them.
+
+    :return: None
+    :rtype: None
+    """
+    global _http_client_users
+
+    _http_client_users = max(_http_client_users - 1, 0)
+    if not _http_client_users:
+        await _discard_http_client()
+
+
+async def close_http_client() -> None:
+    """
+    Closes the shared httpx.AsyncClient and its connections, even if clients still use them.
+
+    Call this when shutting down an application, the next request opens a new client.
+
+    :return: None
+    :rtype: None
+    """
+    await _discard_http_client()
+
+
 async def send_post_request(**kwargs) -> httpx.Response:
     """
     Sends a POST request using httpx.
@@ -87,10 +206,10 @@ async def send_post_request(**kwargs) -> httpx.Response:
     :return: The full response object.
     :rtype: httpx.Response
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(**kwargs, headers={"User-Agent": ""})
-        response.raise_for_status()
-        return response
+    client = await _get_http_client()
+    response = await client.post(**kwargs)
+    response.raise_for_status()
+    return response
 
 
 async def send_get_request(**kwargs) -> httpx.Response:
@@ -103,10 +222,22 @@ async def send_get_request(**kwargs) -> httpx.Response:
     :return: The full response object.
     :rtype: httpx.Response
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(**kwargs, headers={"User-Agent": ""})
-        response.raise_for_status()
-        return response
+    client = await _get_http_client()
+    response = await client.get(**kwargs)
+    response.raise_for_status()
+    return response
+
+
+async def send_post_batch(requests: Iterable[dict]) -> list[httpx.Response]:
+    """
+    Sends several POST requests at the same time over the shared connections.
+
+    :param requests: The keyword arguments of every request, as passed to `send_post_request`.
+    :type requests: Iterable[dict]
+    :return: The responses, in the same order as the requests.
+    :rtype: list[httpx.Response]
+    """
+    return await asyncio.gather(*(send_post_request(**kwargs) for kwargs in requests))
 
 
 async def write(buffer: BytesIO, path: str) -> None:
@@ -16,11 +16,12 @@ from gd.str_helpers import (
     parse_level_data,
     parse_comma_separated_int_list,
     parse_key_value_pairs,
+    parse_comments_data,
     determine_level_difficulty,
     determine_list_difficulty,
     string_to_seconds,
 )
-from gd.cryptography import base64_urlsafe_decode
+from gd.cryptography import base64_urlsafe_decode, base64_urlsafe_decode_str
 from gd.enums import (
     LevelRating,
     ModRank,
@@ -207,6 +208,7 @@ class Level(GDItem):
         :return: A Level object created from the parsed data.
         """
         parsed = parsed_str
+
         return Level(
             # raw_str=parsed_str,
             id=parsed.get("1"),
@@ -238,8 +240,11 @@ class Level(GDItem):
             level_password=(
                 None if isinstance(parsed.get("27"), bool) else parsed.get("27")
             ),
+            # Songs newer than the OfficialSong enum resolve to None instead of raising
             official_song=(
-                OfficialSong(parsed.get("12")) if parsed.get("12") else None
+                OfficialSong.by_value(parsed.get("12"))
+                if parsed.get("12")
+                else None
             ),
         )
 
@@ -469,13 +474,42 @@ class Comment(GDItem):
         :return: A Comment object created from the raw data.
         """
 
-        parsed = raw_str.split(":")
-        user_value = parse_key_value_pairs(parsed[1], "~")
-        comment_value = parse_key_value_pairs(parsed[0], "~")
+        comment_part, _, user_part = raw_str.partition(":")
+        comment_value = parse_key_value_pairs(comment_part, "~")
+        # Not the cached decoder, comments are rarely seen again
+        comment_value["2"] = base64_urlsafe_decode(comment_value.get("2", "")).decode()
+
+        return Comment.from_parsed(
+            {"comment": comment_value, "user": parse_key_value_pairs(user_part, "~")}
+        )
+
+    @staticmethod
+    def from_raw_many(raw_page: str) -> list["Comment"]:
+        """
+        A staticmethod that parses a page of raw comments and returns Comment objects.
+
+        :param raw_page: The raw page of comments from the server, pagination info included.
+        :type raw_page: str
+        :return: A list of Comment objects, empty if the page has no comments.
+        :rtype: list[Comment]
+        """
+        return [Comment.from_parsed(parsed) for parsed in parse_comments_data(raw_page)]
+
+    @staticmethod
+    def from_parsed(parsed: dict) -> "Comment":
+        """
+        A staticmethod that converts a parsed comment into a Comment object.
+
+        :param parsed: A comment parsed by `parse_comments_data`, content already decoded.
+        :type parsed: dict
+        :return: A Comment object created from the parsed data.
+        """
+        comment_value = parsed["comment"]
+        user_value = parsed["user"]
 
         return Comment(
             level_id=int(comment_value.get("1", 0)),
-            content=base64_urlsafe_decode(comment_value.get("2", "")).decode(),
+            content=comment_value["2"],
             author_player_id=int(comment_value.get("3", 0)),
             author_account_id=int(user_value.get("16", 0)),
             likes=int(comment_value.get("4", 0)),
@@ -483,11 +517,11 @@ class Comment(GDItem):
             is_spam=bool(int(comment_value.get("7", 0))),
             posted_ago=string_to_seconds(comment_value.get("9", "0 seconds")),
             percentage=int(comment_value.get("10", 0)),
-            mod_level=ModRank(int(comment_value.get("11", 0))),
+            mod_level=ModRank.by_value(comment_value.get("11", 0), ModRank.NONE),
             author_name=user_value.get("1", ""),
             author_icon=Icon(
                 user_value.get("9", ""),
-                gamemode=Gamemode(int(user_value.get("14", 0))),
+                gamemode=Gamemode.by_value(user_value.get("14", 0), Gamemode.CUBE),
                 primary_color_id=int(user_value.get("10", 1)),
                 secondary_color_id=int(user_value.get("11", 1)),
                 glow_color_id=None,
@@ -621,7 +655,7 @@ class LevelList(_ListLevels):
             id=int(parsed.get("1", 0)),
             name=parsed.get("2", ""),
             level_ids=parse_comma_separated_int_list(parsed.get("51", "")),
-            description=base64_urlsafe_decode(parsed.get("3", "")).decode(),
+            description=base64_urlsafe_decode_str(parsed.get("3", "")),
             difficulty=determine_list_difficulty(parsed.get("7", None)),
             downloads=int(parsed.get("10", 0)),
             likes=int(parsed.get("14", 0)),
@@ -723,7 +757,7 @@ class MapPack(_ListLevels):
             level_ids=parse_comma_separated_int_list(parsed.get("3", "")),
             stars=int(parsed.get("4", 0)),
             coins=int(parsed.get("5", 0)),
-            difficulty=Difficulty(int(parsed.get("6", 0))),
+            difficulty=Difficulty.by_value(int(parsed.get("6", 0)), Difficulty.NA),
             text_rgb_color=tuple(parse_comma_separated_int_list(parsed.get("7", ""))),
             progress_bar_rgb_color=tuple(
                 parse_comma_separated_int_list(parsed.get("8", ""))
@@ -133,7 +133,9 @@ class MusicLibrary:
         @staticmethod
         def from_raw(
             raw_str: str,
-            artists_list: list["MusicLibrary.Artist"],
+            artists_list: Union[
+                dict[str, "MusicLibrary.Artist"], list["MusicLibrary.Artist"]
+            ],
             tags_list: list[str] = None,
         ) -> "MusicLibrary.Song":
             """
@@ -141,17 +143,17 @@ class MusicLibrary:
 
             :param raw_str: The raw str returned from the servers.
             :type raw_str: str
-            :param artists_list: A dictionary of artist IDs to `MusicLibraryArtist` instances.
-            :type artists_list: dict[int, MusicLibraryArtist]
+            :param artists_list: A dictionary of artist IDs (as strings) to `MusicLibraryArtist` instances, or a list of them.
+            :type artists_list: Union[dict[str, MusicLibraryArtist], list[MusicLibraryArtist]]
             :return: An instance of a MusicLibrarySong.
             """
 
             parsed = raw_str.strip().split(",")
 
-            song_artist = None
-            for artist in artists_list:
-                if str(artist.id) == parsed[2]:
-                    song_artist = artist
+            if not isinstance(artists_list, dict):
+                artists_list = {str(artist.id): artist for artist in artists_list}
+
+            song_artist = artists_list.get(parsed[2])
 
             raw_song_tag_list = parsed[5].split(".")
             song_tag_list = {
@@ -205,8 +207,10 @@ class MusicLibrary:
             if tag.strip()
         }
 
+        # Index the artists once, so every song finds its artist in one lookup
+        artists_by_id = {str(artist.id): artist for artist in artists}
         songs = [
-            MusicLibrary.Song.from_raw(song, artists, tags)
+            MusicLibrary.Song.from_raw(song, artists_by_id, tags)
             for song in parsed[2].split(";")
             if song.strip()
         ]
@@ -235,7 +239,6 @@ class MusicLibrary:
             filter_artists = {filter_artists}
 
         for song in self.songs:
-            print(song.tags)
             if filter_tags and not filter_tags.issubset(song.tags):
                 continue
             if filter_artists and song.artist.name not in filter_artists:
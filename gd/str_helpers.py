@@ -14,13 +14,18 @@ __all__ = [
     "parse_comma_separated_int_list",
 ]
 
-from typing import Union
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Union
 
 from .enums import Difficulty, DemonDifficulty
-from .cryptography import base64_urlsafe_decompress, base64_urlsafe_decode
+from .cryptography import (
+    base64_urlsafe_decompress,
+    base64_urlsafe_decode_str,
+    base64_urlsafe_decode_many,
+)
 
 
-def parse_key_value_pairs(text: str, separator: str = ":") -> dict[str, any]:
+def parse_key_value_pairs(text: str, separator: str = ":") -> dict[str, Any]:
     """
     Parse key-value pairs from a separator-separated string.
 
@@ -39,140 +44,213 @@ def parse_key_value_pairs(text: str, separator: str = ":") -> dict[str, any]:
     :param separator: The separator to parse the string (Default is `:`)
     :type separator: str
     :return: A dictionary containing the parsed key-value pairs.
-    :rtype: dict[str, any]
+    :rtype: dict[str, Any]
     """
-    text = text.split("#")[0]
-    pairs = {}
-    # Parse key-valye pairs
-    for index in range(0, len(items := text.split(separator)), 2):
-        key, value = items[index], items[index + 1] if index + 1 < len(items) else None
+    items = text.partition("#")[0].split(separator)
+    if len(items) % 2:
+        # A dangling key without a value
+        items.append(None)
+
+    # Automatically convert str to int if applicable, negative numbers included.
+    # Checked with str methods up front, never by catching int()'s ValueError.
+    # isdecimal rather than isdigit, which also accepts "²" that int() rejects.
+    values = [
+        (
+            int(value)
+            if value
+            and (value.isdecimal() or (value[0] == "-" and value[1:].isdecimal()))
+            else value
+        )
+        for value in items[1::2]
+    ]
+
+    # Pair up keys and values straight from the split, the dict is then built in C.
+    # Keys are deliberately not passed through sys.intern: the per-key call
+    # costs more than the identity shortcut saves on the later lookups.
+    return dict(zip(items[::2], values))
+
+
+def _decode_level_description(value: str) -> Optional[str]:
+    return base64_urlsafe_decode_str(value) if value else None
+
+
+def _decode_level_data(value: str) -> Optional[str]:
+    return base64_urlsafe_decompress(value) if value else None
+
 
-        # Automatically convert str to int if applicable
-        pairs[key] = int(value) if value and value.isdigit() else value
+def _decode_level_password(value: str) -> Optional[str]:
+    # Unprotected levels send "0"
+    if value is None or value == "0":
+        return None
 
-    return pairs
+    password = base64_urlsafe_decode_str(value)
+    return None if password == "\x03" else password
 
 
-def parse_level_data(text: str) -> dict[str, any]:
+def _keep_level_field(value: Optional[str]) -> Optional[str]:
+    # The raw string, or None for a dangling key
+    return value
+
+
+# How the level fields that aren't numbers are decoded, straight from the raw
+# strings. Every other field is converted like in `parse_key_value_pairs`, so a
+# level named "123" or with a single song ID isn't turned into an int.
+_LEVEL_FIELD_DECODERS = {
+    "2": _keep_level_field,
+    "3": _decode_level_description,
+    "4": _decode_level_data,
+    "27": _decode_level_password,
+    "52": _keep_level_field,
+    "53": _keep_level_field,
+}
+
+
+def parse_level_data(text: str) -> dict[str, Any]:
     """
     Parse level data from a string.
 
     :param text: The string containing level data.
     :type text: str
     :return: A dictionary containing parsed level data.
-    :rtype: dict[str, any]
+    :rtype: dict[str, Any]
     """
-    # Parsing the data
-    parsed = parse_key_value_pairs(text)
-
-    # Decrypt specific values
-    parsed["4"] = (
-        base64_urlsafe_decompress(parsed.get("4")) if parsed.get("4") else None
-    )
-    parsed["3"] = (
-        base64_urlsafe_decode(parsed.get("3")).decode() if parsed.get("3") else None
-    )
-    parsed["27"] = (
-        base64_urlsafe_decode(parsed.get("27")).decode()
-        if parsed.get("27") not in [None, "0"]
-        else None
-    )
+    items = text.partition("#")[0].split(":")
+    if len(items) % 2:
+        # A dangling key without a value
+        items.append(None)
+
+    decoders = _LEVEL_FIELD_DECODERS
+    parsed = {
+        key: (
+            decoders[key](value)
+            if key in decoders
+            else (
+                int(value)
+                if value
+                and (value.isdecimal() or (value[0] == "-" and value[1:].isdecimal()))
+                else value
+            )
+        )
+        for key, value in zip(items[::2], items[1::2])
+    }
 
-    if parsed["27"] == "\x03":
-        parsed["27"] = None
+    # The decoded fields are always there, even if the server left them out
+    for key in ("3", "4", "27"):
+        parsed.setdefault(key, None)
 
     return parsed
 
 
-def parse_search_results(text: str) -> list[dict[str, any]]:
+def parse_search_results(text: str) -> list[dict[str, Any]]:
     """
     Parse search results from a response string.
 
     :param text: The string containing search results.
     :type text: str
     :return: A list of dictionaries containing parsed level, creator, and song data.
-    :rtype: list[dict[str, any]]
+    :rtype: list[dict[str, Any]]
     """
     # Split the text into individual level data, creator data, and song data.
+    sections = text.split("#")
     levels_data, creators_data, songs_data = (
-        text.split("#")[0].split("|"),
-        text.split("#")[1].split("|"),
-        text.split("#")[2].split("~:~"),
+        sections[0].split("|"),
+        sections[1].split("|"),
+        sections[2].split("~:~"),
     )
 
     # The list of levels' data parsed.
     parsed_levels = [{"level": parse_level_data(level)} for level in levels_data]
 
-    # Match each level's creator data
+    # Index the creators by player ID and the songs by song ID, so each level is
+    # matched with a lookup instead of scanning all of them.
+    creators = {
+        creator_info[0]: creator_info
+        for creator_info in (creator.split(":") for creator in creators_data)
+    }
+    songs = {
+        parsed_song.get("1"): parsed_song
+        for parsed_song in (parse_song_data(song) for song in songs_data)
+    }
+
     for current_level in parsed_levels:
         level_data = current_level["level"]
-        user_id = str(level_data.get("6"))  # User ID from level data
-        creator_info = next(
-            (
-                creator.split(":")
-                for creator in creators_data
-                if creator.startswith(user_id)
-            ),
-            None,
-        )
 
         # Add creator information if available
+        creator_info = creators.get(str(level_data.get("6")))
         current_level["creator"] = {
             "playerID": creator_info[0] if creator_info else None,
             "playerName": creator_info[1] if creator_info else None,
             "accountID": int(creator_info[2]) if creator_info else None,
         }
 
-    # Match each level's song data
-    for song in songs_data:
-        parsed_song = parse_song_data(song)
-
-        # Connect the song to the correct level
-        for current_level in parsed_levels:
-            level_data = current_level["level"]
-            if level_data.get("35") == 0:
-                current_level["song"] = None
-            elif level_data.get("35") == int(parsed_song.get("1", -1)):
-                current_level["song"] = parsed_song
+        # Official songs (custom song ID 0) and missing songs have no song data
+        custom_song_id = level_data.get("35")
+        current_level["song"] = songs.get(custom_song_id) if custom_song_id else None
 
     return parsed_levels
 
 
-def parse_user_data(text: str) -> dict[str, any]:
+def parse_user_data(text: str) -> dict[str, Any]:
     """
     Parse user data from a string.
 
     :param text: The string containing user data.
     :type text: str
     :return: A dictionary containing parsed user data.
-    :rtype: dict[str, any]
+    :rtype: dict[str, Any]
     """
     # Literally parse_key_value_pairs lol
     return parse_key_value_pairs(text)
 
 
-def parse_comments_data(text: str) -> list[dict[str, any]]:
+def parse_comments_data(text: str) -> list[dict[str, Any]]:
     """
-    Parse comments data from a string.
+    Parse a page of comments from a string.
+
+    Raw:
+    ```
+    2~SGk=~6~123:1~Player~9~5|2~...:1~...#10:0:20
+    ```
+    Parsed:
+    ```
+    [{"comment": {"2": "Hi", "6": 123}, "user": {"1": "Player", "9": 5}}, ...]
+    ```
 
-    :param text: The string containing comments data.
+    :param text: The string containing comments data, pagination info included.
     :type text: str
-    :return: A list of dictionaries containing parsed comments.
-    :rtype: list[dict[str, any]]
+    :return: A list of dictionaries containing the parsed comment and author of every comment.
+    :rtype: list[dict[str, Any]]
     """
-    # Parsing multiple comments, not 1 comment.
-    items = text.split("|")
-    return [{"comment": parse_key_value_pairs(item)} for item in items]
+    # The page info after "#" is dropped, and an empty page gives no comments.
+    comments = [
+        {
+            "comment": parse_key_value_pairs(comment, "~"),
+            "user": parse_key_value_pairs(user, "~"),
+        }
+        for comment, _, user in (
+            item.partition(":") for item in text.partition("#")[0].split("|") if item
+        )
+    ]
+
+    # Decode the contents of the whole page together, the comments are rarely
+    # seen again so they are not worth caching like descriptions.
+    contents = base64_urlsafe_decode_many(
+        parsed["comment"].get("2", "") for parsed in comments
+    )
+    for parsed, content in zip(comments, contents):
+        parsed["comment"]["2"] = content.decode()
+
+    return comments
 
 
-def parse_song_data(song: str) -> dict[str, any]:
+def parse_song_data(song: str) -> dict[str, Any]:
     """
     Parse song data from a string.
 
     :param song: The string containing song data.
     :type song: str
     :return: A dictionary containing parsed song data.
-    :rtype: dict[str, any]
+    :rtype: dict[str, Any]
     """
     # Literally parse_key_value_pairs again lol, i'm so funni!!!!!
     return parse_key_value_pairs(song.replace("~", ""), "|")
@@ -197,28 +275,37 @@ def _gamesave_to_dict(xml: str) -> dict:
     if dictionary is None:
         return {}  # Return an empty dictionary if <dict> is not found
 
-    def parse_element(element):
-        data = {}
-        for child in element:
-            if child.tag == "k":
-                key = child.text
-                value_elem = child.getnext()
-                if value_elem is not None:
-                    if value_elem.tag == "r":
-                        data[key] = float(value_elem.text)
-                    elif value_elem.tag == "s":
-                        data[key] = value_elem.text
-                    elif value_elem.tag == "i":
-                        data[key] = int(value_elem.text)
-                    elif value_elem.tag == "t":
-                        data[key] = True
-                    elif value_elem.tag == "d":
-                        data[key] = parse_element(
-                            value_elem
-                        )  # Recursive call for nested <d>
-        return data
-
-    return parse_element(dictionary)
+    return _parse_plist_dict(dictionary)
+
+
+def _parse_plist_dict(element) -> dict:
+    """
+    Parse a `<d>` element of a gamesave into a dictionary.
+
+    :param element: The `<d>` element.
+    :return: A dictionary of the keys and their parsed values.
+    :rtype: dict
+    """
+    data = {}
+    parsers = _PLIST_VALUE_PARSERS
+    for child in element:
+        if child.tag == "k":
+            value_elem = child.getnext()
+            if value_elem is not None:
+                parser = parsers.get(value_elem.tag)
+                if parser is not None:
+                    data[child.text] = parser(value_elem)
+    return data
+
+
+# Value parsers for the gamesave plist, by the tag of the value element
+_PLIST_VALUE_PARSERS = {
+    "r": lambda element: float(element.text),
+    "s": lambda element: element.text,
+    "i": lambda element: int(element.text),
+    "t": lambda element: True,
+    "d": _parse_plist_dict,  # Nested <d>
+}
 
 
 # Difficulty Determinatiom
@@ -244,7 +331,32 @@ def determine_level_difficulty(
         # Return AUTO if auto
         return Difficulty.AUTO
     # If not, return the normal difficulties
-    return Difficulty(parsed.get("9", 0) // 10)
+    return Difficulty.by_value(parsed.get("9", 0) // 10, Difficulty.NA)
+
+
+_SEARCH_DIFFICULTIES = {
+    Difficulty.NA: -1,
+    Difficulty.AUTO: -3,
+    Difficulty.DEMON: -2,
+    Difficulty.EASY: 1,
+    Difficulty.NORMAL: 2,
+    Difficulty.HARD: 3,
+    Difficulty.HARDER: 4,
+    Difficulty.INSANE: 5,
+}
+
+# The same values, already formatted for the comma-separated search parameter
+_SEARCH_DIFFICULTY_STRINGS = {
+    difficulty: str(value) for difficulty, value in _SEARCH_DIFFICULTIES.items()
+}
+
+_DEMON_SEARCH_DIFFICULTIES = {
+    DemonDifficulty.EASY_DEMON: 1,
+    DemonDifficulty.MEDIUM_DEMON: 2,
+    DemonDifficulty.HARD_DEMON: 3,
+    DemonDifficulty.INSANE_DEMON: 4,
+    DemonDifficulty.EXTREME_DEMON: 5,
+}
 
 
 def determine_search_difficulty(difficulty_obj: Difficulty) -> int:
@@ -256,18 +368,21 @@ def determine_search_difficulty(difficulty_obj: Difficulty) -> int:
     :return: Integer representing the search difficulty.
     :rtype: int
     """
-    difficulty_map = {
-        Difficulty.NA: -1,
-        Difficulty.AUTO: -3,
-        Difficulty.DEMON: -2,
-        Difficulty.EASY: 1,
-        Difficulty.NORMAL: 2,
-        Difficulty.HARD: 3,
-        Difficulty.HARDER: 4,
-        Difficulty.INSANE: 5,
-    }
+    return _SEARCH_DIFFICULTIES.get(difficulty_obj, -1)
 
-    return difficulty_map.get(difficulty_obj, -1)
+
+def determine_search_difficulties(difficulties: Iterable[Difficulty]) -> str:
+    """
+    Converts Difficulty objects to the comma-separated value used by search requests.
+
+    :param difficulties: The difficulty objects.
+    :type difficulties: Iterable[:class:`gd.entities.enums.Difficulty`]
+    :return: The comma-separated search difficulties.
+    :rtype: str
+    """
+    return ",".join(
+        [_SEARCH_DIFFICULTY_STRINGS.get(diff, "-1") for diff in difficulties]
+    )
 
 
 def determine_demon_search_difficulty(difficulty_obj: DemonDifficulty) -> int:
@@ -280,25 +395,11 @@ def determine_demon_search_difficulty(difficulty_obj: DemonDifficulty) -> int:
     :rtype: int
     :raises ValueError: If the demon difficulty object type is invalid.
     """
-
-    result = None
-
-    # Convert the object to an interger value based on the search's enums.
-    match difficulty_obj:
-        case DemonDifficulty.EASY_DEMON:
-            result = 1
-        case DemonDifficulty.MEDIUM_DEMON:
-            result = 2
-        case DemonDifficulty.HARD_DEMON:
-            result = 3
-        case DemonDifficulty.INSANE_DEMON:
-            result = 4
-        case DemonDifficulty.EXTREME_DEMON:
-            result = 5
-        case _:
-            raise ValueError(
-                f"Invalid demon difficulty object type {type(difficulty_obj)}"
-            )
+    result = _DEMON_SEARCH_DIFFICULTIES.get(difficulty_obj)
+    if result is None:
+        raise ValueError(
+            f"Invalid demon difficulty object type {type(difficulty_obj)}"
+        )
 
     return result
 
@@ -347,30 +448,37 @@ def parse_comma_separated_int_list(key: str) -> list[int]:
         return []
 
 
+_SECONDS_PER_UNIT = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,
+    "year": 31536000,
+}
+
+
+@lru_cache(maxsize=256)
 def string_to_seconds(string: str) -> int:
     """
     Convert a string ("0 seconds") to seconds.
 
+    Results are cached, a page of comments tends to repeat the same few strings.
+
     :param string: The string representing time in seconds.
     :type string: str
     :return: The time in seconds.
     """
-    splitted_string = string.split(" ")
-    value = int(splitted_string[0])
-    unit = splitted_string[1]
-
-    if "second" in unit:
-        return value
-    if "minute" in unit:
-        return value * 60
-    if "hour" in unit:
-        return value * 3600
-    if "day" in unit:
-        return value * 86400
-    if "week" in unit:
-        return value * 604800
-    if "month" in unit:
-        return value * 2592000
-    if "year" in unit:
-        return value * 31536000
+    value, _, unit = string.partition(" ")
+    value = int(value)
+
+    factor = _SECONDS_PER_UNIT.get(unit.removesuffix("s"))
+    if factor is not None:
+        return value * factor
+
+    # Fall back to a substring match for anything unusually formatted
+    for name, factor in _SECONDS_PER_UNIT.items():
+        if name in unit:
+            return value * factor
     raise ValueError("Invalid unit.")
@@ -3,7 +3,11 @@
 A module containing all the classes and methods related to users and accounts in Geometry Dash.
 """
 
-from typing import Optional, Literal, NamedTuple
+import asyncio
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Optional, Literal, Mapping, NamedTuple
 
 import attr
 
@@ -16,7 +20,7 @@ from gd.enums import Gamemode, ModRank, Item, Shard, ChestType
 from gd.cosmetics import IconSet
 from gd.level import Comment, LevelDisplay
 from gd.gdobject import GDItem
-from gd.cryptography import base64_urlsafe_decode, gjp2
+from gd.cryptography import base64_urlsafe_decode, base64_urlsafe_decode_many, gjp2
 from gd.helpers import require_client
 from gd.type_hints import (
     AccountId,
@@ -38,34 +42,77 @@ __all__ = [
     "Chest",
 ]
 
-DifficultyStats = NamedTuple(
-    "DifficultyStats",
-    [
-        ("auto", int),
-        ("easy", int),
-        ("normal", int),
-        ("hard", int),
-        ("harder", int),
-        ("insane", int),
-        ("daily", Optional[int]),
-        ("gauntlet", Optional[int]),
-    ],
+
+class DifficultyStats(NamedTuple):
+    """A namedtuple for how many different levels of difficulty the player has beaten."""
+
+    auto: int
+    easy: int
+    normal: int
+    hard: int
+    harder: int
+    insane: int
+    daily: Optional[int] = None
+    gauntlet: Optional[int] = None
+
+
+class DemonStats(NamedTuple):
+    """A namedtuple for how many different demon levels the player has beaten."""
+
+    easy: int
+    medium: int
+    hard: int
+    insane: int
+    extreme: int
+    weekly: Optional[int] = None
+    gauntlet: Optional[int] = None
+
+
+# Positions of each demon difficulty in the server's comma-separated demon list
+_CLASSIC_DEMON_STATS = itemgetter(0, 1, 2, 3, 4, 10, 11)
+_PLATFORMER_DEMON_STATS = itemgetter(5, 6, 7, 8, 9)
+
+# (attribute, key, default) for the Player fields that are copied as-is
+_PLAYER_FIELDS = (
+    ("name", "1", None),
+    ("player_id", "2", 0),
+    ("account_id", "16", 0),
+    ("moons", "52", 0),
+    ("demons", "4", 0),
+    ("diamonds", "46", None),
+    ("rank", "6", None),
+    ("creator_points", "8", 0),
+    ("secret_coins", "13", 0),
+    ("user_coins", "17", 0),
+    ("primary_color_id", "10", 0),
+    ("secondary_color_id", "11", 0),
+    ("glow_color_id", "51", None),
+    ("twitter", "44", None),
+    ("twitch", "45", None),
 )
-"""A namedtuple for how many different levels of difficulty the player has beaten."""
 
-DemonStats = NamedTuple(
-    "DemonStats",
-    [
-        ("easy", int),
-        ("medium", int),
-        ("hard", int),
-        ("insane", int),
-        ("extreme", int),
-        ("weekly", Optional[int]),
-        ("gauntlet", Optional[int]),
-    ],
+# What the servers send in place of the YouTube channel when none is set
+_NO_YOUTUBE = r"%%00"
+
+# (IconSet.load argument, key) for the icon and color IDs. Missing keys are left
+# out, their IconSet.load defaults match the Player field defaults.
+_ICON_FIELDS = (
+    ("cube", "21"),
+    ("ship", "22"),
+    ("ball", "23"),
+    ("ufo", "24"),
+    ("wave", "25"),
+    ("robot", "26"),
+    ("spider", "43"),
+    ("swing", "53"),
+    ("jetpack", "54"),
+    ("primary_color", "10"),
+    ("secondary_color", "11"),
+    ("glow_color", "51"),
 )
-"""A namedtuple for how many different demon levels the player has beaten."""
+
+# Shared by every player whose response carries no icon data at all
+_NO_ICON_IDS = MappingProxyType({})
 
 
 @attr.define(slots=True)
@@ -110,17 +157,54 @@ class AccountComment(GDItem):
         :return: A Post instance.
         :rtype: Post
         """
-        parsed = raw_str.split(":")
-        comment_value = parse_key_value_pairs(parsed[0], "~")
+        # Only the part before the first ":" is used, so don't split the rest
+        comment_value = parse_key_value_pairs(raw_str.partition(":")[0], "~")
 
         return AccountComment(
             content=base64_urlsafe_decode(comment_value.get("2", "")),
             likes=int(comment_value.get("4", 0)),
-            id=int(comment_value.get("6", 0)),
+            id=comment_value.get("6", 0),
             posted_ago=string_to_seconds(comment_value.get("9", "0 seconds")),
             author_account_id=account_id,
         )
 
+    @staticmethod
+    def from_raw_many(
+        raw_page: str, account_id: int = None
+    ) -> list["AccountComment"]:
+        """
+        A static method that converts a whole page of raw account comments into AccountComment instances.
+
+        The page is split once and the contents of every comment are decoded with a
+        single `base64_urlsafe_decode_many` call.
+
+        :param raw_page: The raw page of account comments from the server, pagination info included.
+        :type raw_page: str
+        :param account_id: The account ID of the user, optional if not provided.
+        :type account_id: Union[int, None]
+        :return: A list of AccountComment instances.
+        :rtype: list[AccountComment]
+        """
+        comment_values = [
+            parse_key_value_pairs(raw_str.partition(":")[0], "~")
+            for raw_str in raw_page.partition("#")[0].split("|")
+            if raw_str
+        ]
+        contents = base64_urlsafe_decode_many(
+            comment_value.get("2", "") for comment_value in comment_values
+        )
+
+        return [
+            AccountComment(
+                content=content,
+                likes=int(comment_value.get("4", 0)),
+                id=comment_value.get("6", 0),
+                posted_ago=string_to_seconds(comment_value.get("9", "0 seconds")),
+                author_account_id=account_id,
+            )
+            for comment_value, content in zip(comment_values, contents)
+        ]
+
     @require_client(login=True)
     async def like(self, dislike: bool = False) -> None:
         """
@@ -134,6 +218,75 @@ class AccountComment(GDItem):
         await self.client.like_post(self.id, dislike)
 
 
+@lru_cache(maxsize=1024)
+def _parse_player(raw_str: str, parse_leaderboard_score: bool) -> dict:
+    """
+    Parse the string data of a player into the keyword arguments for `Player`.
+
+    Cached, since polling leaderboards and friend lists keeps returning the same
+    payloads. Only immutable values are shared between the players built from it.
+
+    :param raw_str: The raw data from the server.
+    :type raw_str: str
+    :param parse_leaderboard_score: Whether to parse the leaderboard score or not.
+    :type parse_leaderboard_score: bool
+    :return: The keyword arguments to construct the Player with.
+    :rtype: dict
+    """
+    parsed = parse_key_value_pairs(raw_str)
+    # Local aliases for the names looked up more than once below
+    get = parsed.get
+    int_list = parse_comma_separated_int_list
+
+    fields = {name: get(key, default) for name, key, default in _PLAYER_FIELDS}
+
+    icon_ids = {name: parsed[key] for name, key in _ICON_FIELDS if key in parsed}
+
+    demon_stats = get("55")
+    if demon_stats:
+        demon_stats = int_list(demon_stats)
+
+    normal_stats = get("56")
+    if normal_stats:
+        normal_stats = int_list(normal_stats)
+
+    platformer_stats = get("57")
+    if platformer_stats:
+        platformer_stats = int_list(platformer_stats)
+
+    youtube = get("20")
+
+    fields.update(
+        stars=get("3", 0) if not parse_leaderboard_score else 0,
+        registered=get("29") == 1,
+        mod_level=ModRank.by_value(get("49", 0), ModRank.NONE),
+        is_friend=get("31") == 1,
+        accept_requests=get("19") == 0,
+        profile_icon_type=Gamemode.by_value(get("14", 1), Gamemode.SHIP),
+        youtube=youtube if youtube != _NO_YOUTUBE else None,
+        classic_demon_stats=(
+            DemonStats(*_CLASSIC_DEMON_STATS(demon_stats))
+            if demon_stats
+            else None
+        ),
+        platformer_demon_stats=(
+            DemonStats(*_PLATFORMER_DEMON_STATS(demon_stats))
+            if demon_stats
+            else None
+        ),
+        classic_stats=(
+            DifficultyStats(*normal_stats[:8]) if normal_stats else None
+        ),
+        platformer_stats=(
+            DifficultyStats(*platformer_stats[:7]) if platformer_stats else None
+        ),
+        icon_ids=MappingProxyType(icon_ids) if icon_ids else _NO_ICON_IDS,
+        leaderboard_set_ago=string_to_seconds(get("42", "0 seconds")),
+        leaderboard_value=get("3") if parse_leaderboard_score else None,
+    )
+    return fields
+
+
 @attr.define(slots=True)
 class Player(GDItem):
     """
@@ -236,8 +389,16 @@ class Player(GDItem):
     """The glow color id of the user's icon."""
     profile_icon_type: Optional[Gamemode] = None
     """The gamemode that the user primarily chooses to display."""
-    icons: IconSet = None
-    """The icon set of the user."""
+    _icons: Optional[IconSet] = None
+    """The icon set of the user, if it was given directly."""
+    _icon_ids: Optional[Mapping] = attr.field(
+        default=None, repr=lambda ids: "None" if ids is None else repr(dict(ids))
+    )
+    """The raw icon and color IDs the icon set is built from."""
+    _built_icons: Optional[IconSet] = attr.field(
+        default=None, init=False, repr=False, eq=False
+    )
+    """The icon set built from `_icon_ids` on first access, left out of comparisons."""
 
     youtube: Optional[str] = None
     """The YouTube channel link of the user."""
@@ -272,98 +433,56 @@ class Player(GDItem):
         :return: An instance of the Player class.
         :rtype: Player
         """
-        parsed = parse_key_value_pairs(raw_str)
+        return Player(**_parse_player(raw_str, parse_leaderboard_score))
 
-        demon_stats = parsed.get("55", None)
-        if demon_stats:
-            demon_stats = parse_comma_separated_int_list(demon_stats)
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Clear the cache of parsed player data used by `Player.from_raw`.
 
-        normal_stats = parsed.get("56", None)
-        if normal_stats:
-            normal_stats = parse_comma_separated_int_list(normal_stats)
+        :return: None
+        :rtype: None
+        """
+        _parse_player.cache_clear()
 
-        platformer_stats = parsed.get("57", None)
-        if platformer_stats:
-            platformer_stats = parse_comma_separated_int_list(platformer_stats)
+    @staticmethod
+    def from_raw_batch(
+        raw_page: str, parse_leaderboard_score: bool = False
+    ) -> list["Player"]:
+        """
+        Parse a whole `|`-separated page of players from the servers in one call.
 
-        primary_color = int(parsed.get("10", 0))
-        secondary_color = int(parsed.get("11", 0))
-        glow_color = (
-            int(parsed.get("51")) if parsed.get("51", None) is not None else None
-        )
+        :param raw_page: The raw page from the server, pagination info included.
+        :type raw_page: str
+        :param parse_leaderboard_score: Whether to parse the leaderboard score or not.
+        :type parse_leaderboard_score: bool
+        :return: A list of Player instances, empty entries are skipped.
+        :rtype: list[Player]
+        """
+        from_raw = Player.from_raw
+        return [
+            from_raw(raw_str, parse_leaderboard_score)
+            for raw_str in raw_page.partition("#")[0].split("|")
+            if raw_str
+        ]
 
-        return Player(
-            name=parsed.get("1", None),
-            player_id=parsed.get("2", 0),
-            account_id=parsed.get("16", 0),
-            stars=parsed.get("3", 0) if not parse_leaderboard_score else 0,
-            moons=parsed.get("52", 0),
-            demons=parsed.get("4", 0),
-            diamonds=parsed.get("46"),
-            rank=parsed.get("6"),
-            creator_points=parsed.get("8", 0),
-            secret_coins=parsed.get("13", 0),
-            user_coins=parsed.get("17", 0),
-            registered=parsed.get("29") == 1,
-            mod_level=ModRank(parsed.get("49", 0)),
-            is_friend=parsed.get("31") == 1,
-            accept_requests=parsed.get("19") == 0,
-            profile_icon_type=Gamemode(parsed.get("14", 1)),
-            primary_color_id=primary_color,
-            secondary_color_id=secondary_color,
-            glow_color_id=glow_color,
-            youtube=parsed.get("20", None) if parsed.get("20") != r"%%00" else None,
-            twitter=parsed.get("44"),
-            twitch=parsed.get("45"),
-            classic_demon_stats=(
-                DemonStats(
-                    easy=demon_stats[0],
-                    medium=demon_stats[1],
-                    hard=demon_stats[2],
-                    insane=demon_stats[3],
-                    extreme=demon_stats[4],
-                    weekly=demon_stats[10],
-                    gauntlet=demon_stats[11],
-                )
-                if demon_stats
-                else None
-            ),
-            platformer_demon_stats=(
-                DemonStats(
-                    easy=demon_stats[5],
-                    medium=demon_stats[6],
-                    hard=demon_stats[7],
-                    insane=demon_stats[8],
-                    extreme=demon_stats[9],
-                    weekly=None,
-                    gauntlet=None,
-                )
-                if demon_stats
-                else None
-            ),
-            classic_stats=(DifficultyStats(*normal_stats) if normal_stats else None),
-            platformer_stats=(
-                DifficultyStats(*platformer_stats, gauntlet=None)
-                if platformer_stats
-                else None
-            ),
-            icons=IconSet.load(
-                cube=parsed.get("21", 1),
-                ship=parsed.get("22", 1),
-                ball=parsed.get("23", 1),
-                ufo=parsed.get("24", 1),
-                wave=parsed.get("25", 1),
-                robot=parsed.get("26", 1),
-                spider=parsed.get("43", 1),
-                swing=parsed.get("53", 1),
-                jetpack=parsed.get("54", 1),
-                primary_color=primary_color,
-                secondary_color=secondary_color,
-                glow_color=glow_color,
-            ),
-            leaderboard_set_ago=string_to_seconds(parsed.get("42", "0 seconds")),
-            leaderboard_value=int(parsed.get("3")) if parse_leaderboard_score else None,
-        )
+    @property
+    def icons(self) -> Optional[IconSet]:
+        """
+        The icon set of the user.
+
+        Built from the raw icon IDs the first time it is accessed, so listings
+        that never look at cosmetics don't pay for it.
+
+        :return: The icon set of the user.
+        :rtype: Optional[IconSet]
+        """
+        if self._icons is not None:
+            return self._icons
+
+        if self._built_icons is None and self._icon_ids is not None:
+            self._built_icons = IconSet.load(**self._icon_ids)
+        return self._built_icons
 
     @require_client()
     async def account_comments(self, page: int = 0) -> list[AccountComment]:
@@ -408,6 +527,26 @@ class Player(GDItem):
 
         return await self.client.get_user_levels(self.player_id, page)
 
+    @require_client()
+    async def load_all(
+        self, page: int = 0
+    ) -> tuple[list[AccountComment], list[Comment], list[LevelDisplay]]:
+        """
+        Load the user's account comments, comments history and levels concurrently.
+
+        The three requests are sent at the same time, so this takes as long as the
+        slowest of them instead of their sum.
+
+        :param page: The page number to load for each of them, default is 0.
+        :type page: int
+        :return: The account comments, comments and levels, always in that order.
+        :rtype: tuple[list[AccountComment], list[Comment], list[LevelDisplay]]
+        """
+        account_comments, comments, levels = await asyncio.gather(
+            self.account_comments(page), self.comments(page), self.levels(page)
+        )
+        return account_comments, comments, levels
+
 
 @attr.define(slots=True, frozen=True)
 class Quest:
@@ -504,10 +643,17 @@ class Account:
     """Name of the account."""
     password: str
     """Plaintext password of the account."""
+    _gjp2: str = attr.field(
+        default=attr.Factory(lambda self: gjp2(self.password), takes_self=True),
+        kw_only=True,
+        repr=False,
+        eq=False,
+    )
+    """The GJP2 hash of the password, computed once since the account is frozen. Can be passed as `gjp2` when it is already known."""
 
     @property
     def gjp2(self) -> str:
         """
         Generate GJP2 hash from password. (Recommended)
         """
-        return gjp2(self.password)
+        return self._gjp2
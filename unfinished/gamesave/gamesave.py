@@ -27,7 +27,7 @@ from gd.type_hints import (
 from gd.cosmetics import IconSet
 from gd.enums import Gamemode
 from gd.user import Account
-from unfinished.gamesave.helpers import filter_valuekeeper_keys_by_type
+from unfinished.gamesave.helpers import group_valuekeeper_keys_by_type
 
 # Boilerplates
 
@@ -154,7 +154,7 @@ class Gamesave:
         decoded = singular_xor(gamesave, int(XorKey.GAMESAVE))
         decompressed = base64_urlsafe_gzip_decompress(decoded)
         gamesave = _gamesave_to_dict(decompressed)
-        valuekeeper = gamesave.get("valueKeeper")
+        unlocks = group_valuekeeper_keys_by_type(gamesave.get("valueKeeper"))
 
         return Gamesave(
             music_volume=gamesave.get("bgVolume", 0.0),
@@ -203,26 +203,20 @@ class Gamesave:
             clicked_editor_guide=gamesave.get("showedEditorGuide", False),
             clicked_ldm=gamesave.get("showedLowDetailDialog", False),
             clicked_rating_explanation=gamesave.get("showedRateStarDialog", False),
-            unlocked_cubes=filter_valuekeeper_keys_by_type(valuekeeper, "i"),
-            unlocked_ships=filter_valuekeeper_keys_by_type(valuekeeper, "ship"),
-            unlocked_balls=filter_valuekeeper_keys_by_type(valuekeeper, "ball"),
-            unlocked_ufos=filter_valuekeeper_keys_by_type(valuekeeper, "bird"),
-            unlocked_waves=filter_valuekeeper_keys_by_type(valuekeeper, "dart"),
-            unlocked_robots=filter_valuekeeper_keys_by_type(valuekeeper, "robot"),
-            unlocked_spiders=filter_valuekeeper_keys_by_type(valuekeeper, "spider"),
-            unlocked_swings=filter_valuekeeper_keys_by_type(valuekeeper, "swing"),
-            unlocked_jetpacks=filter_valuekeeper_keys_by_type(valuekeeper, "jetpack"),
-            unlocked_primary_colors=filter_valuekeeper_keys_by_type(valuekeeper, "c0"),
-            unlocked_secondary_colors=filter_valuekeeper_keys_by_type(
-                valuekeeper, "c1"
-            ),
-            unlocked_trails=filter_valuekeeper_keys_by_type(valuekeeper, "streak"),
-            unlocked_ship_trails=filter_valuekeeper_keys_by_type(
-                valuekeeper, "shipstreak"
-            ),
-            unlocked_death_effects=filter_valuekeeper_keys_by_type(
-                valuekeeper, "death"
-            ),
+            unlocked_cubes=unlocks.get("i", []),
+            unlocked_ships=unlocks.get("ship", []),
+            unlocked_balls=unlocks.get("ball", []),
+            unlocked_ufos=unlocks.get("bird", []),
+            unlocked_waves=unlocks.get("dart", []),
+            unlocked_robots=unlocks.get("robot", []),
+            unlocked_spiders=unlocks.get("spider", []),
+            unlocked_swings=unlocks.get("swing", []),
+            unlocked_jetpacks=unlocks.get("jetpack", []),
+            unlocked_primary_colors=unlocks.get("c0", []),
+            unlocked_secondary_colors=unlocks.get("c1", []),
+            unlocked_trails=unlocks.get("streak", []),
+            unlocked_ship_trails=unlocks.get("shipstreak", []),
+            unlocked_death_effects=unlocks.get("death", []),
         )
 
     # def xml(self) -> str:
@@ -14,8 +14,33 @@ def filter_valuekeeper_keys_by_type(valuekeeper: dict, key_type: str) -> list[in
     :return: A list of valuekeeper keys of the specified type.
     :rtype: list[any]
     """
+    # Only the matching keys are cut, the rest are skipped with one startswith
+    prefix = key_type + "_"
+    start = len(prefix)
     return [
-        int(key.split("_")[1])
-        for key in valuekeeper.keys()
-        if key_type == key.split("_")[0]
+        int(key[start:].partition("_")[0])
+        for key in valuekeeper
+        if key.startswith(prefix)
     ]
+
+
+def group_valuekeeper_keys_by_type(valuekeeper: dict) -> dict[str, list[int]]:
+    """
+    Group all valuekeeper keys by their type in a single pass.
+
+    Use this instead of calling `filter_valuekeeper_keys_by_type` for every type,
+    which goes through the whole valuekeeper each time.
+
+    :param valuekeeper: The valuekeeper of the gamesave.
+    :type valuekeeper: dict
+    :return: The numbers of the keys of every type, in the same order as the valuekeeper.
+    :rtype: dict[str, list[int]]
+    """
+    grouped = {}
+    for key in valuekeeper:
+        key_type, _, rest = key.partition("_")
+        number = rest.partition("_")[0]
+        # Keys without a number aren't unlocks
+        if number.isdecimal():
+            grouped.setdefault(key_type, []).append(int(number))
+    return grouped
@@ -17,11 +17,9 @@ from gd.type_hints import SongFileHubId, SongId, LevelId
 
 
 def _is_int(value: str) -> bool:
-    try:
-        int(value)
-        return True
-    except ValueError:
-        return False
+    # Checked with str methods instead of raising and catching int()'s ValueError
+    value = str(value)
+    return value.isdecimal() or (value[:1] == "-" and value[1:].isdecimal())
 
 
 # * Literals, Enums